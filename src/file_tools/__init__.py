@@ -3,12 +3,21 @@
 """File operation tools for MCP server."""
 
 # Imports for functions still in use
-from src.file_tools.directory_utils import list_files, find_files_spotlight, find_files_ripgrep # Assuming these are exposed if needed
-from src.file_tools.edit_file import edit_file
+from src.file_tools.directory_utils import (  # Assuming these are exposed if needed
+    find_files_ripgrep,
+    find_files_spotlight,
+    iter_files,
+    list_entries,
+    list_files,
+    list_files_detailed,
+    list_files_recursive,
+)
+from src.file_tools.edit_file import edit_file, edit_files
 from src.file_tools.file_operations import (
     append_file,
     delete_file,
     read_file,
+    read_files_bulk,
     save_file,
     write_file, # write_file is an alias for save_file
 )
@@ -19,12 +28,18 @@ from src.file_tools.file_operations import (
 __all__ = [
     # REMOVED: "normalize_path",
     "read_file",
+    "read_files_bulk",
     "write_file", # Keep alias if used
     "save_file",
     "append_file",
     "delete_file",
     "list_files",
+    "list_entries",
+    "list_files_recursive",
+    "iter_files",
+    "list_files_detailed",
     "edit_file",
+    "edit_files",
     "find_files_spotlight", # Add if you intend to expose these via `from src.file_tools import *`
     "find_files_ripgrep", # Add if you intend to expose these via `from src.file_tools import *`
-]
\ No newline at end of file
+]
@@ -1,17 +1,48 @@
 # src/file_tools/edit_file.py (Revised for Absolute Paths)
 
-import difflib
+import bisect
 import logging
+import multiprocessing
 import os
-import re
+import stat
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from .file_operations import _write_content, read_file, save_file
+
+try:
+    # Optional: a Rust implementation whose output is identical to difflib's
+    from difflib_rs import unified_diff as _unified_diff
+except ImportError:
+    from difflib import unified_diff as _unified_diff
 
 # REMOVED: from .path_utils import normalize_path
 
 logger = logging.getLogger(__name__)
 
+# Tabs become spaces so normalize_whitespace only has to collapse runs of spaces
+_TAB_TO_SPACE = str.maketrans("\t", " ")
+
+# Diffs of files with at least this many lines leave out unchanged lines that
+# difflib would only match as part of the blocks before and after the change
+# (see _diff_window); smaller diffs are left entirely to difflib
+_DIFF_TRIM_MIN_LINES = 200
+_DIFF_CONTEXT = 3
+# difflib's autojunk: with at least this many lines in b, lines occurring more
+# than len(b) // 100 + 1 times are "popular" and never start a match
+_AUTOJUNK_MIN_LINES = 200
+# apply_edits only batches up to this many edits: the batched path checks every
+# pair of edits for interactions, which outgrows the copies it saves
+_BATCH_MAX_EDITS = 32
+# edit_files only uses worker processes for at least this many bytes of input:
+# each spawned worker re-imports the package, which costs more than editing
+# smaller files inline
+_PROCESS_POOL_MIN_BYTES = 8 * 1024 * 1024
+
 
 @dataclass
 class EditOperation:
@@ -25,17 +56,24 @@ class EditOptions:
     """Optional formatting settings for edit operations."""
     preserve_indentation: bool = True
     normalize_whitespace: bool = True # Note: This option might be less useful now
+    return_diff: bool = True # Only honoured when writing; dry runs always get a diff
 
 
 class MatchResult:
     """Stores information about a match attempt."""
     def __init__(
-        self, matched: bool, line_index: int = -1, line_count: int = 0, details: str = ""
+        self,
+        matched: bool,
+        line_index: int = -1,
+        line_count: int = 0,
+        details: str = "",
+        start_pos: int = -1,
     ):
         self.matched = matched
         self.line_index = line_index
         self.line_count = line_count
         self.details = details
+        self.start_pos = start_pos
 
     def __repr__(self) -> str:
         return (f"MatchResult(matched={self.matched}, line_index={self.line_index}, line_count={self.line_count})")
@@ -45,16 +83,21 @@ class MatchResult:
 # ... (Keep normalize_line_endings, normalize_whitespace, get_line_indentation, preserve_indentation, find_exact_match, create_unified_diff, apply_edits) ...
 
 def normalize_line_endings(text: str) -> str:
+    # A single-character scan is much cheaper than searching for "\r\n", and
+    # LF-only text (the common case) needs no replacement at all
+    if "\r" not in text:
+        return text
     return text.replace("\r\n", "\n")
 
 def normalize_whitespace(text: str) -> str:
-    result = re.sub(r"[ \t]+", " ", text)
-    result = "\n".join(line.strip() for line in result.split("\n"))
-    return result
+    # Dropping the empty pieces of split(" ") collapses each run of spaces (and
+    # tabs, after translate) to one; strip() still removes other edge whitespace
+    lines = text.translate(_TAB_TO_SPACE).split("\n")
+    return "\n".join(" ".join(filter(None, line.split(" "))).strip() for line in lines)
 
 def get_line_indentation(line: str) -> str:
-    match = re.match(r"^(\s*)", line)
-    return match.group(1) if match else ""
+    # lstrip() strips exactly the characters r"\s" matches, without a regex call
+    return line[:len(line) - len(line.lstrip())]
 
 def preserve_indentation(old_text: str, new_text: str) -> str:
     if ("- " in new_text or "* " in new_text) and ("- " in old_text or "* " in old_text):
@@ -62,10 +105,26 @@ def preserve_indentation(old_text: str, new_text: str) -> str:
     old_lines = old_text.split("\n")
     new_lines = new_text.split("\n")
     if not old_lines or not new_lines: return new_text
+    # Nothing to re-indent when every line keeps the indentation of the line it
+    # replaces (and empty lines stay empty), the common case for content edits
+    if len(old_lines) == len(new_lines) and all(
+        not new_line
+        or (new_line.strip() and old_line.strip() and get_line_indentation(old_line) == get_line_indentation(new_line))
+        for old_line, new_line in zip(old_lines, new_lines)
+    ):
+        return new_text
     base_indent = get_line_indentation(old_lines[0]) if old_lines and old_lines[0].strip() else ""
-    old_indents = { i: get_line_indentation(line) for i, line in enumerate(old_lines) if line.strip() }
+    # Old lines past the end of the new text are never looked up
+    old_indents = { i: get_line_indentation(line) for i, line in enumerate(old_lines[:len(new_lines)]) if line.strip() }
     new_indents = { i: get_line_indentation(line) for i, line in enumerate(new_lines) if line.strip() }
     first_new_indent_len = len(new_indents.get(0, "")) if new_indents else 0
+    # Earlier lines indented in both texts, as candidates for the nearest previous
+    # line with a new indent no deeper than the current one. A candidate is dropped
+    # once a later one is at most as deep, since the later one then always wins; the
+    # remaining lengths strictly increase, so each lookup is a bisect instead of a
+    # backward scan over all previous lines.
+    anchor_lens: List[int] = []
+    anchor_lines: List[int] = []
     result_lines = []
     for i, new_line in enumerate(new_lines):
         if not new_line.strip():
@@ -78,48 +137,301 @@ def preserve_indentation(old_text: str, new_text: str) -> str:
         elif first_new_indent_len > 0:
             curr_indent_len = len(new_indent)
             target_indent = base_indent
-            for prev_i in range(i - 1, -1, -1):
-                if prev_i in old_indents and prev_i in new_indents:
-                    prev_old = old_indents[prev_i]
-                    prev_new = new_indents[prev_i]
-                    if len(prev_new) <= curr_indent_len:
-                        relative_spaces = curr_indent_len - len(prev_new)
-                        target_indent = prev_old + " " * relative_spaces
-                        break
+            pos = bisect.bisect_right(anchor_lens, curr_indent_len)
+            if pos:
+                prev_i = anchor_lines[pos - 1]
+                relative_spaces = curr_indent_len - anchor_lens[pos - 1]
+                target_indent = old_indents[prev_i] + " " * relative_spaces
         else: target_indent = new_indent
         result_lines.append(target_indent + new_line.lstrip())
+        if i in old_indents:
+            indent_len = len(new_indent)
+            while anchor_lens and anchor_lens[-1] >= indent_len:
+                anchor_lens.pop()
+                anchor_lines.pop()
+            anchor_lens.append(indent_len)
+            anchor_lines.append(i)
     return "\n".join(result_lines)
 
 def find_exact_match(content: str, pattern: str) -> MatchResult:
-    if pattern in content:
-        lines_before = content[: content.find(pattern)].count("\n")
+    # A single find() both tests for the match and locates it
+    start_pos = content.find(pattern)
+    if start_pos >= 0:
+        lines_before = content.count("\n", 0, start_pos)
         line_count = pattern.count("\n") + 1
-        return MatchResult(matched=True, line_index=lines_before, line_count=line_count, details="Exact match found")
+        return MatchResult(matched=True, line_index=lines_before, line_count=line_count, details="Exact match found", start_pos=start_pos)
     return MatchResult(matched=False, details="No exact match found")
 
 def create_unified_diff(original: str, modified: str, file_path: str) -> str:
-    original_lines = original.splitlines(True)
-    modified_lines = modified.splitlines(True)
-    diff_lines = difflib.unified_diff(original_lines, modified_lines, fromfile=f"a/{file_path}", tofile=f"b/{file_path}", lineterm="")
-    return "".join(diff_lines)
+    return create_unified_diff_lines(original.splitlines(True), modified.splitlines(True), file_path)
+
+def create_unified_diff_lines(original_lines: List[str], modified_lines: List[str], file_path: str) -> str:
+    # For callers that already hold both sides as lines (with their line
+    # endings, as from splitlines(True)), so neither text is split again
+    if original_lines == modified_lines:
+        return ""
+    window = None
+    if max(len(original_lines), len(modified_lines)) >= _DIFF_TRIM_MIN_LINES:
+        window = _diff_window(original_lines, modified_lines)
+    if window is None:
+        diff_lines = _unified_diff(original_lines, modified_lines, fromfile=f"a/{file_path}", tofile=f"b/{file_path}", n=_DIFF_CONTEXT, lineterm="")
+        return "".join(diff_lines)
+    start, tail, popular = window
+    return "".join(_windowed_unified_diff(original_lines, modified_lines, start, tail, popular, file_path))
+
+# _diff_window and _windowed_unified_diff reproduce difflib.unified_diff's output
+# from a trimmed window, so they depend on these details of the stdlib difflib
+# (unchanged since Python 2.7) that are not part of its documented API:
+# - SequenceMatcher's autojunk rule: with len(b) >= 200, lines occurring more
+#   than len(b) // 100 + 1 times in b are "popular" and removed from b2j
+# - find_longest_match returns the longest match that starts earliest in a,
+#   then earliest in b; lines missing from b2j can extend a match but never
+#   start one
+# - get_matching_blocks recurses on both sides of the longest match
+# - unified_diff formats hunk ranges as _format_range_unified does
+# test_create_unified_diff_window_matches_difflib checks the output against
+# difflib.unified_diff itself, so a change to any of these fails there.
+def _diff_window(a: List[str], b: List[str]) -> Optional[Tuple[int, int, Set[str]]]:
+    """
+    Find how many unchanged lines can be left out at both ends of a diff.
+
+    difflib matches the longest run of shared non-popular lines first and then
+    recurses on either side of it. The shared first and last lines of a and b
+    form one block each, so once both blocks are certain to be matched before
+    anything near the change, lines of those blocks further out only shorten
+    the blocks and never change the result. That holds when the kept part of
+    each block has a run of non-popular lines longer than any run that can
+    involve the change: such a run can only be extended by lines that occur
+    in b more than once. When the two blocks overlap, the one difflib picks
+    first also takes the overlap, so its longest run is kept as well.
+
+    Returns:
+        (start, tail, popular): the number of lines to leave out at the start
+        and at the end of both sides, and the lines of b that difflib treats as
+        popular in the whole file; or None if no lines can be left out.
+    """
+    len_a, len_b = len(a), len(b)
+    limit = min(len_a, len_b)
+    prefix = next((i for i, (x, y) in enumerate(zip(a, b)) if x != y), limit)
+    suffix = next((i for i, (x, y) in enumerate(zip(reversed(a), reversed(b))) if x != y), limit)
+    counts = Counter(b)
+    popular: Set[str] = set()
+    if len_b >= _AUTOJUNK_MIN_LINES:
+        popular_count = len_b // 100 + 1
+        popular = {line for line, count in counts.items() if count > popular_count}
+
+    # Lines before lo and the last hi lines belong to only one end block each
+    lo = min(prefix, len_a - suffix, len_b - suffix)
+    hi = min(suffix, len_a - prefix, len_b - prefix)
+    def repeated(line: str) -> bool:
+        return line not in popular and counts[line] > 1
+    involving_change = max(
+        _count_while(a, range(lo - 1, -1, -1), repeated) + (len_a - hi - lo) + _count_while(a, range(len_a - hi, len_a), repeated),
+        _count_while(b, range(lo - 1, -1, -1), repeated) + (len_b - hi - lo) + _count_while(b, range(len_b - hi, len_b), repeated),
+    )
+    needed = involving_change + 1
+
+    # Nearest such run on each side, scanning outwards from the change
+    run_start = _run_at(a, range(lo - 1, -1, -1), needed, popular)
+    start = 0 if run_start is None else min(run_start, lo - _DIFF_CONTEXT)
+    run_end = _run_at(a, range(len_a - hi, len_a), needed, popular)
+    end = len_a if run_end is None else max(run_end + 1, len_a - hi + _DIFF_CONTEXT)
+
+    if lo < prefix or hi < suffix:
+        prefix_run, prefix_end = _longest_run(a, 0, prefix, popular)
+        suffix_run, suffix_end = _longest_run(a, len_a - suffix, len_a, popular)
+        if max(prefix_run, suffix_run) <= involving_change:
+            return None
+        # On a tie difflib keeps the run it reaches first: lower index in a,
+        # then lower index in b
+        prefix_first = prefix_run > suffix_run or (
+            prefix_run == suffix_run
+            and (prefix_end < suffix_end or (prefix_end == suffix_end and len_b > len_a))
+        )
+        if prefix_first:
+            start = min(start, prefix_end - prefix_run + 1)
+        else:
+            end = max(end, suffix_end + 1)
+
+    start = max(0, start)
+    tail = max(0, len_a - end)
+    if not start and not tail:
+        return None
+    return start, tail, popular
+
+def _count_while(lines: List[str], indexes: range, predicate: Callable[[str], bool]) -> int:
+    # Number of leading indexes whose line satisfies predicate
+    count = 0
+    for k in indexes:
+        if not predicate(lines[k]):
+            break
+        count += 1
+    return count
+
+def _run_at(lines: List[str], indexes: range, length: int, popular: Set[str]) -> Optional[int]:
+    # Index at which the first run of length non-popular lines is complete
+    current = 0
+    for k in indexes:
+        current = current + 1 if lines[k] not in popular else 0
+        if current == length:
+            return k
+    return None
+
+def _longest_run(lines: List[str], start: int, stop: int, popular: Set[str]) -> Tuple[int, int]:
+    # Length and last index of the first longest run of non-popular lines
+    best = best_end = current = 0
+    for k in range(start, stop):
+        current = current + 1 if lines[k] not in popular else 0
+        if current > best:
+            best, best_end = current, k
+    return best, best_end
+
+def _windowed_unified_diff(a: List[str], b: List[str], start: int, tail: int, popular: Set[str], file_path: str) -> Iterator[str]:
+    """
+    Produce difflib.unified_diff's lines for a and b from a window of them.
+
+    unified_diff cannot be told which lines are popular in the whole file, so
+    the matcher is built here with autojunk off and the popular lines removed
+    from its index, and the output is formatted as unified_diff formats it.
+    """
+    window_a = a[start:len(a) - tail]
+    window_b = b[start:len(b) - tail]
+    matcher = SequenceMatcher(None, window_a, window_b, autojunk=False)
+    # What autojunk does to b2j, but with popularity taken from the whole file
+    for line in popular:
+        matcher.b2j.pop(line, None)
+    started = False
+    for group in matcher.get_grouped_opcodes(_DIFF_CONTEXT):
+        if not started:
+            started = True
+            yield f"--- a/{file_path}"
+            yield f"+++ b/{file_path}"
+        first, last = group[0], group[-1]
+        yield f"@@ -{_format_hunk_range(first[1] + start, last[2] + start)} +{_format_hunk_range(first[3] + start, last[4] + start)} @@"
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in window_a[i1:i2]:
+                    yield " " + line
+                continue
+            if tag in ("replace", "delete"):
+                for line in window_a[i1:i2]:
+                    yield "-" + line
+            if tag in ("replace", "insert"):
+                for line in window_b[j1:j2]:
+                    yield "+" + line
+
+def _format_hunk_range(start: int, stop: int) -> str:
+    # Same as difflib's range format: "start,length", 1-based, with an empty
+    # range given as the line before it and a single line without a length
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+def _apply_edits_batched(content: str, edits: List[Tuple[str, str]], options: EditOptions) -> Optional[Tuple[str, List[Dict[str, Any]], bool]]:
+    """
+    Apply edits located in the original content with a single join.
+
+    Sequential application copies the whole content once per edit. When every
+    edit matches the original content and no edit can see the effect of an
+    earlier one, the result is the same as applying them in order, so all
+    replacements are located first and the output is assembled in one pass.
+    Returns None whenever that cannot be guaranteed, so the caller falls back to
+    sequential application. Edits are (old_text, new_text) pairs with line
+    endings already normalized.
+    """
+    skip_result = "No change needed - text already matches desired state"
+    located = []  # (start, end, new_text, edit_index, old_text)
+    match_results: List[Optional[Dict[str, Any]]] = []
+    for i, (normalized_old, normalized_new) in enumerate(edits):
+        if normalized_old == normalized_new:
+            match_results.append({"edit_index": i, "match_type": "skipped", "details": skip_result})
+            continue
+        if not normalized_old:
+            return None
+        start_pos = content.find(normalized_old)
+        if start_pos < 0:
+            # Failed and already-applied edits depend on earlier edits' output
+            return None
+        if options.preserve_indentation:
+            normalized_new = preserve_indentation(normalized_old, normalized_new)
+        located.append((start_pos, start_pos + len(normalized_old), normalized_new, i, normalized_old))
+        match_results.append(None)
+
+    if not located:
+        return content, match_results, False
+
+    # The original text around a replacement is only reliable as context if the
+    # next replacement is at least one pattern length away
+    context = max(len(old) for *_, old in located) - 1
+    spans = sorted(located)
+    for prev, cur in zip(spans, spans[1:]):
+        if cur[0] - prev[1] < context:
+            return None
+
+    # An edit applied in order would see every earlier edit located before it.
+    # If its old text occurs in the text produced around such a replacement, the
+    # sequential result could differ, so give up on batching. Each window is built
+    # once; the spacing check above means original text in it lies before the
+    # next replacement, where no edit's old text can first occur.
+    line_delta = {index: new.count("\n") - old.count("\n") for _, _, new, index, old in located}
+    windows = {index: content[max(0, start - context):start] + new + content[end:end + context] for start, end, new, index, _ in located}
+    line_shift = {}
+    for start_j, _, _, index_j, old_j in located:
+        shift = 0
+        for start_i, _, _, index_i, _ in located:
+            if index_i >= index_j or start_i >= start_j:
+                continue
+            if old_j in windows[index_i]:
+                return None
+            shift += line_delta[index_i]
+        line_shift[index_j] = shift
+
+    fragments = []
+    prev_end = 0
+    lines_before = 0
+    for start_pos, end_pos, new_text, i, normalized_old in spans:
+        # Newlines are counted incrementally, so the content is scanned only once
+        lines_before += content.count("\n", prev_end, start_pos)
+        match_results[i] = {
+            "edit_index": i,
+            "match_type": "exact",
+            "line_index": lines_before + line_shift[i],
+            "line_count": normalized_old.count("\n") + 1,
+        }
+        lines_before += normalized_old.count("\n")
+        fragments.append(content[prev_end:start_pos])
+        fragments.append(new_text)
+        prev_end = end_pos
+    fragments.append(content[prev_end:])
+    return "".join(fragments), match_results, True
 
 def apply_edits(content: str, edits: List[EditOperation], options: Optional[EditOptions] = None) -> Tuple[str, List[Dict[str, Any]], bool]:
     if options is None: options = EditOptions()
     normalized_content = normalize_line_endings(content)
+    # Normalize each edit once, whichever way the edits end up being applied
+    normalized_edits = [(normalize_line_endings(edit.old_text), normalize_line_endings(edit.new_text)) for edit in edits]
+    if 1 < len(normalized_edits) <= _BATCH_MAX_EDITS:
+        batched = _apply_edits_batched(normalized_content, normalized_edits, options)
+        if batched is not None:
+            return batched
     match_results = []
     changes_made = False
-    for i, edit in enumerate(edits):
-        normalized_old = normalize_line_endings(edit.old_text)
-        normalized_new = normalize_line_endings(edit.new_text)
+    for i, (normalized_old, normalized_new) in enumerate(normalized_edits):
         if normalized_old == normalized_new:
             match_results.append({"edit_index": i, "match_type": "skipped", "details": "No change needed - text already matches desired state"})
             continue
-        if normalized_new in normalized_content and normalized_old not in normalized_content:
+        exact_match = find_exact_match(normalized_content, normalized_old)
+        # Only an edit whose old text is gone can already be applied, so the
+        # content is only searched for the new text when the old text is missing
+        if not exact_match.matched and normalized_new in normalized_content:
             match_results.append({"edit_index": i, "match_type": "skipped", "details": "Edit already applied - content already in desired state"})
             continue
-        exact_match = find_exact_match(normalized_content, normalized_old)
         if exact_match.matched:
-            start_pos = normalized_content.find(normalized_old)
+            start_pos = exact_match.start_pos
             end_pos = start_pos + len(normalized_old)
             if options.preserve_indentation:
                 normalized_new = preserve_indentation(normalized_old, normalized_new)
@@ -131,6 +443,49 @@ def apply_edits(content: str, edits: List[EditOperation], options: Optional[Edit
             logger.warning(f"Could not find exact match for edit {i}")
     return normalized_content, match_results, changes_made
 
+def _write_edited_file(abs_path: Path, content: str) -> None:
+    """
+    Atomically replace the contents of an existing file.
+
+    The new content is written to a temporary file that is renamed over the
+    target, so a crash never leaves a half-written file. Symlinks are followed,
+    as an in-place write would, and the file keeps its permission bits. A file
+    that is not writable is still refused, even though renaming over it would
+    succeed.
+
+    The file is instead rewritten in place, as before atomic writes, when a
+    rename would not give the same result: the directory is not writable, the
+    file has other hard links, or it belongs to another owner or group.
+
+    Raises:
+        PermissionError: If the file is not writable.
+        ValueError: If content contains unencodable characters.
+    """
+    target = Path(os.path.realpath(abs_path))
+    if not os.access(target, os.W_OK):
+        raise PermissionError(f"Permission denied: '{abs_path}'")
+    st = os.stat(target)
+    in_place = (
+        not os.access(target.parent, os.W_OK | os.X_OK)
+        or st.st_nlink > 1
+        or (hasattr(os, "geteuid") and (st.st_uid, st.st_gid) != (os.geteuid(), os.getegid()))
+    )
+    if not in_place:
+        save_file(target, content, mode=stat.S_IMODE(st.st_mode))
+        return
+
+    logger.debug(f"Rewriting {abs_path} in place")
+    try:
+        # Fail before the file is truncated
+        content.encode("utf-8")
+    except UnicodeEncodeError as e:
+        raise ValueError("Content contains characters that cannot be encoded.") from e
+    fd = os.open(target, os.O_WRONLY | os.O_TRUNC | getattr(os, "O_BINARY", 0))
+    try:
+        _write_content(fd, content)
+    finally:
+        os.close(fd)
+
 # --- Main edit_file function (Modified) ---
 
 def edit_file(
@@ -147,10 +502,12 @@ def edit_file(
         abs_path: Absolute Path object of the file to edit.
         edits: List of edit operations with old_text and new_text.
         dry_run: If True, only preview changes without applying them.
-        options: Optional formatting settings (e.g., preserve_indentation).
+        options: Optional formatting settings (e.g., preserve_indentation, or
+            return_diff=False to skip building the diff when not in dry run mode).
 
     Returns:
         Dict with diff output and match information including success status.
+        The diff is None if return_diff is False and dry_run is False.
     """
     # Path validation happens in the caller (_validate_abs_path)
     # Basic edits validation remains
@@ -158,16 +515,14 @@ def edit_file(
 
     file_path_str = str(abs_path) # Use string representation for messages/diffs
 
-    # Validate file path exists
-    if not abs_path.is_file():
-        logger.error(f"File not found or not a file: {file_path_str}")
-        raise FileNotFoundError(f"File not found or not a file: {file_path_str}")
-
-    # Read file content
+    # Read file content with one sized read; read_file reports missing paths and
+    # directories itself, so no separate is_file() stat is needed
     try:
-        with open(abs_path, "r", encoding="utf-8") as f:
-            original_content = f.read()
-    except UnicodeDecodeError as e:
+        original_content = read_file(abs_path)
+    except (FileNotFoundError, IsADirectoryError) as e:
+        logger.error(f"File not found or not a file: {file_path_str}")
+        raise FileNotFoundError(f"File not found or not a file: {file_path_str}") from e
+    except ValueError as e:
         logger.error(f"Unicode decode error while reading {file_path_str}: {str(e)}")
         raise ValueError(f"File '{file_path_str}' contains invalid characters.") from e
     except Exception as e:
@@ -188,6 +543,7 @@ def edit_file(
     edit_options = EditOptions(
         preserve_indentation=options.get("preserve_indentation", True) if options else True,
         normalize_whitespace=options.get("normalize_whitespace", True) if options else True,
+        return_diff=options.get("return_diff", True) if options else True,
     )
 
     # Apply edits
@@ -197,8 +553,14 @@ def edit_file(
             original_content, edit_operations, edit_options
         )
 
-        failed_matches = [r for r in match_results if r.get("match_type") == "failed"]
-        already_applied = [r for r in match_results if r.get("match_type") == "skipped" and "already applied" in r.get("details", "")]
+        # Count failed and already applied edits in a single pass
+        failed_count = already_applied_count = 0
+        for r in match_results:
+            match_type = r.get("match_type")
+            if match_type == "failed":
+                failed_count += 1
+            elif match_type == "skipped" and "already applied" in r.get("details", ""):
+                already_applied_count += 1
 
         result = {
             "match_results": match_results,
@@ -206,25 +568,28 @@ def edit_file(
             "dry_run": dry_run,
         }
 
-        if failed_matches:
+        if failed_count:
             result.update({"success": False, "error": "Failed to find exact match for one or more edits"})
             return result
 
-        if not changes_made or (already_applied and len(already_applied) == len(edits)):
+        if not changes_made or (already_applied_count and already_applied_count == len(edits)):
             result.update({"success": True, "diff": "", "message": "No changes needed - content already in desired state"})
             return result
 
-        # Use string path for diff generation
-        diff = create_unified_diff(original_content, modified_content, file_path_str)
+        # Diffing can cost far more than the edit itself on large files, so it is
+        # skipped when a caller applying the edit has asked not to get it back
+        if dry_run or edit_options.return_diff:
+            # Use string path for diff generation
+            diff = create_unified_diff(original_content, modified_content, file_path_str)
+        else:
+            diff = None
         result.update({"diff": diff, "success": True})
 
         # Write changes if not in dry run mode
         if not dry_run and changes_made:
             try:
-                # Use the absolute Path object for writing
-                with open(abs_path, "w", encoding="utf-8") as f:
-                    f.write(modified_content)
-            except UnicodeEncodeError as e:
+                _write_edited_file(abs_path, modified_content)
+            except ValueError as e:
                 logger.error(f"Unicode encode error while writing to {file_path_str}: {str(e)}")
                 result.update({"success": False, "error": "Content contains characters that cannot be encoded."})
                 return result
@@ -243,4 +608,57 @@ def edit_file(
             "error": error_msg,
             "match_results": match_results if match_results else [{"edit_index": 0, "match_type": "failed", "details": f"Exception: {error_msg}"}],
             "file_path": file_path_str,
-        }
\ No newline at end of file
+        }
+
+
+def _edit_file_item(item: Tuple[Path, List[Dict[str, str]], bool, Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Run edit_file on one (abs_path, edits, dry_run, options) tuple in a worker process."""
+    return edit_file(*item)
+
+
+def _total_size(paths: Set[str]) -> int:
+    """Sum the sizes of the given files; missing files count as empty."""
+    total = 0
+    for path in paths:
+        try:
+            total += os.stat(path).st_size
+        except OSError:
+            pass  # edit_file reports it
+    return total
+
+
+def edit_files(items: List[Tuple[Path, List[Dict[str, str]], bool, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+    """
+    Apply edit_file to many files, one worker process per CPU.
+
+    Matching and diffing are CPU-bound and hold the GIL, so different files are
+    edited in separate processes. Items are edited one after another in the
+    calling process instead when they name the same file more than once (so that
+    the edits of one item see the result of the previous ones), when only one
+    worker would be used, or when the files are too small in total to pay for
+    starting the workers.
+
+    Args:
+        items: (abs_path, edits, dry_run, options) tuples, as passed to edit_file.
+
+    Returns:
+        The edit_file results, in the order of items.
+
+    Raises:
+        ValueError: If an item's edits are not a valid list of edit operations.
+        FileNotFoundError: If a file does not exist.
+    """
+    targets = {os.path.realpath(item[0]) for item in items}
+    if len(items) <= 1 or len(targets) < len(items):
+        return [_edit_file_item(item) for item in items]
+
+    max_workers = min(os.cpu_count() or 1, len(items))
+    if max_workers <= 1 or _total_size(targets) < _PROCESS_POOL_MIN_BYTES:
+        return [_edit_file_item(item) for item in items]
+
+    logger.debug(f"Editing {len(items)} files with {max_workers} worker processes")
+    # Forking the threaded server process can deadlock on locks held by other
+    # threads, so workers are always started fresh
+    mp_context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+        return list(executor.map(_edit_file_item, items))
@@ -3,13 +3,100 @@
 
 import logging
 import os
-import tempfile
+import stat
+import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, List, Optional
 
 # REMOVED: from .path_utils import normalize_path
 
 logger = logging.getLogger(__name__)
 
+# Below this size the default readahead window already covers the whole file
+_FADVISE_MIN_SIZE = 256 * 1024
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+# Upper bound on threads used by read_files_bulk (mirrors ThreadPoolExecutor's default)
+_BULK_READ_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+
+def _open_regular_file(abs_path: Path) -> int:
+    """
+    Open a regular file for reading and return its descriptor.
+
+    O_NONBLOCK keeps the open from hanging on FIFOs; it has no effect on reads
+    from regular files.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        IsADirectoryError: If the path points to a directory or other non-regular file.
+        PermissionError: If access to the file is denied.
+    """
+    flags = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_NONBLOCK", 0)
+    try:
+        fd = os.open(abs_path, flags)
+    except FileNotFoundError as e:
+        logger.error(f"File not found: {abs_path}")
+        raise FileNotFoundError(f"File '{abs_path}' does not exist") from e
+    except (IsADirectoryError, PermissionError) as e:
+        # Windows reports directories as PermissionError; only then pay for the check
+        if isinstance(e, IsADirectoryError) or abs_path.is_dir():
+            logger.error(f"Path is not a file: {abs_path}")
+            raise IsADirectoryError(f"Path '{abs_path}' is not a file") from e
+        logger.error(f"Permission denied reading file {abs_path}: {str(e)}")
+        raise
+
+    try:
+        # POSIX can open directories and devices read-only, so check the type
+        if not stat.S_ISREG(os.fstat(fd).st_mode):
+            logger.error(f"Path is not a file: {abs_path}")
+            raise IsADirectoryError(f"Path '{abs_path}' is not a file")
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+
+def _read_fd(fd: int) -> bytearray:
+    """
+    Read the whole file behind an open descriptor into a single preallocated buffer.
+
+    The buffer is sized from fstat() plus one spare byte, so an unchanged regular
+    file is read with a single readinto() call that comes back short. Only when
+    that spare byte gets filled, meaning the file grew after the fstat(), is the
+    rest fetched with readall(). Large files get a sequential readahead hint
+    where posix_fadvise() exists.
+    """
+    size = os.fstat(fd).st_size
+    if size >= _FADVISE_MIN_SIZE and _HAS_FADVISE:
+        try:
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_WILLNEED)
+        except OSError as e:
+            # Only a hint; some filesystems reject it
+            logger.debug(f"posix_fadvise failed, reading without readahead hint: {e}")
+    buf = bytearray(size + 1)
+    with open(fd, "rb", buffering=0, closefd=False) as raw:
+        view = memoryview(buf)
+        offset = 0
+        while True:
+            n = raw.readinto(view[offset:])
+            if not n:
+                break  # EOF; the file shrank since fstat()
+            offset += n
+            # Large reads can come back short before EOF, so keep going up to size
+            if offset >= size:
+                break
+        view.release()
+        if offset == len(buf):
+            # The spare byte was filled: the file grew since fstat()
+            buf += raw.readall()
+        else:
+            del buf[offset:]
+    return buf
+
 
 def read_file(abs_path: Path) -> str:
     """
@@ -27,21 +114,21 @@ def read_file(abs_path: Path) -> str:
         PermissionError: If access to the file is denied.
         ValueError: If the file contains invalid characters.
     """
-    # Path validation (existence, is_file) still important
-    if not abs_path.exists():
-        logger.error(f"File not found: {abs_path}")
-        raise FileNotFoundError(f"File '{abs_path}' does not exist")
-
-    if not abs_path.is_file():
-        logger.error(f"Path is not a file: {abs_path}")
-        raise IsADirectoryError(f"Path '{abs_path}' is not a file")
-
-    file_handle = None
+    # Open directly and let the OS report missing paths or directories instead of
+    # paying for separate exists()/is_file() stat calls first
+    fd = _open_regular_file(abs_path)
     try:
         logger.debug(f"Reading file: {abs_path}")
-        # Open using the absolute path directly
-        file_handle = open(abs_path, "r", encoding="utf-8")
-        content = file_handle.read()
+        # Read raw bytes in one sized pass and decode once, skipping the
+        # buffered text layer (TextIOWrapper + incremental decoder)
+        try:
+            data = _read_fd(fd)
+        finally:
+            os.close(fd)
+        content = data.decode("utf-8")
+        # Keep text-mode semantics: universal newlines translate \r\n and \r to \n
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
         logger.debug(f"Successfully read {len(content)} bytes from {abs_path}")
         return content
     except UnicodeDecodeError as e:
@@ -55,18 +142,131 @@ def read_file(abs_path: Path) -> str:
     except Exception as e:
         logger.error(f"Error reading file {abs_path}: {str(e)}")
         raise
+
+
+def read_files_bulk(abs_paths: List[Path]) -> Dict[str, str]:
+    """
+    Read many files specified by absolute Path objects concurrently.
+
+    Each file is read with read_file() on a thread pool, so the open/read/close
+    round trips of different files overlap instead of running back to back.
+
+    Args:
+        abs_paths: Absolute Path objects of the files to read.
+
+    Returns:
+        A dict mapping each path (as a string, in input order) to its contents.
+
+    Raises:
+        FileNotFoundError: If a file does not exist.
+        IsADirectoryError: If a path points to a directory.
+        PermissionError: If access to a file is denied.
+        ValueError: If a file contains invalid characters.
+    """
+    if len(abs_paths) <= 1:
+        return {str(path): read_file(path) for path in abs_paths}
+
+    max_workers = min(_BULK_READ_MAX_WORKERS, len(abs_paths))
+    logger.debug(f"Reading {len(abs_paths)} files with {max_workers} worker threads")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        contents = list(executor.map(read_file, abs_paths))
+    return {str(path): content for path, content in zip(abs_paths, contents)}
+
+
+def _write_content(fd: int, content: str) -> None:
+    """
+    Write text content to an open descriptor as UTF-8.
+
+    On POSIX the content is encoded once and pushed with os.write() directly,
+    bypassing the buffered text layer. Elsewhere the text layer is kept so that
+    newline translation matches text-mode open().
+
+    Raises:
+        UnicodeEncodeError: If the content cannot be encoded as UTF-8.
+    """
+    if os.name != "posix":
+        with open(fd, "w", encoding="utf-8", closefd=False) as f:
+            f.write(content)
+        return
+
+    view = memoryview(content.encode("utf-8"))
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _save_file_tmpfile(abs_path: Path, parent_dir: Path, content: str, mode: Optional[int] = None) -> bool:
+    """
+    Atomically create a new file through an unnamed O_TMPFILE inode (Linux only).
+
+    The inode has no directory entry while it is written, so a crash never leaves
+    a stray temporary file behind. It is published with linkat(AT_SYMLINK_FOLLOW)
+    on /proc/self/fd, which only succeeds if the target does not exist yet; the
+    caller replaces existing files through a named temporary file instead.
+
+    Returns:
+        True if the file was written, False if O_TMPFILE or /proc is unavailable
+        or the target appeared meanwhile, and the caller should fall back to a
+        named temporary file.
+
+    Raises:
+        PermissionError: If access to the directory is denied.
+        ValueError: If content contains unencodable characters.
+    """
+    if not sys.platform.startswith("linux") or not hasattr(os, "O_TMPFILE"):
+        return False
+
+    try:
+        fd = os.open(str(parent_dir), os.O_TMPFILE | os.O_WRONLY, 0o666)
+    except PermissionError:
+        raise
+    except OSError as e:
+        # e.g. EOPNOTSUPP on filesystems without O_TMPFILE support
+        logger.debug(f"O_TMPFILE not usable in {parent_dir}, falling back: {e}")
+        return False
+
+    try:
+        try:
+            _write_content(fd, content)
+        except UnicodeEncodeError as e:
+            logger.error(f"Unicode encode error while writing to temp file for {abs_path}: {str(e)}")
+            raise ValueError("Content contains characters that cannot be encoded.") from e
+        if mode is not None:
+            os.fchmod(fd, mode)
+
+        # An explicit dst_dir_fd makes os.link() use linkat() so AT_SYMLINK_FOLLOW
+        # is honoured; plain link() would try to hard-link the /proc symlink itself
+        fd_path = f"/proc/self/fd/{fd}"
+        dir_fd = os.open(str(parent_dir), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.link(fd_path, abs_path.name, dst_dir_fd=dir_fd, follow_symlinks=True)
+        except FileExistsError:
+            # Created since the caller checked; the unnamed inode is dropped on close
+            logger.debug(f"{abs_path} appeared while writing, falling back")
+            return False
+        except PermissionError:
+            raise
+        except OSError as e:
+            # e.g. /proc not mounted; the unnamed inode is simply dropped on close
+            logger.debug(f"Cannot link O_TMPFILE inode for {abs_path}, falling back: {e}")
+            return False
+        finally:
+            os.close(dir_fd)
+        logger.debug(f"Linked new file {abs_path} from O_TMPFILE inode")
+        return True
     finally:
-        if file_handle is not None:
-            file_handle.close()
+        os.close(fd)
 
 
-def save_file(abs_path: Path, content: str) -> bool:
+def save_file(abs_path: Path, content: str, mode: Optional[int] = None) -> bool:
     """
     Write content to a file specified by an absolute Path object, atomically.
 
     Args:
         abs_path: Absolute Path object of the file to write to.
         content: Content to write to the file.
+        mode: Optional permission bits for the written file, e.g. to keep those of
+            the file being replaced. Ignored where os.fchmod is unavailable.
 
     Returns:
         True if the file was written successfully.
@@ -92,25 +292,40 @@ def save_file(abs_path: Path, content: str) -> bool:
         logger.error(f"Error creating directory {parent_dir}: {str(e)}")
         raise
 
+    # On Linux, new files are created from an unnamed O_TMPFILE inode that only
+    # appears once complete. Linking it can never replace an existing file, so
+    # overwrites (the common case) go straight to the renamed temporary file
+    if not hasattr(os, "fchmod"):
+        mode = None
+    if not os.path.lexists(abs_path) and _save_file_tmpfile(abs_path, parent_dir, content, mode):
+        logger.debug(f"Successfully wrote {len(content)} bytes to {abs_path}")
+        return True
+
     # Use a temporary file for atomic write
     temp_file_path_obj = None
-    temp_file_handle = None
     try:
-        # Create temp file in the same directory as the target
-        # Use delete=False and manage cleanup manually for more control
-        temp_file_handle = tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', dir=str(parent_dir), delete=False)
-        temp_file_path_obj = Path(temp_file_handle.name)
+        # Create temp file in the same directory as the target. Like the O_TMPFILE
+        # path it is opened with 0o666 so new files get the umask-derived mode
+        # rather than mkstemp's 0o600; the finally block below handles cleanup
+        temp_file_path_obj = parent_dir / f".{abs_path.name}.{uuid.uuid4().hex}.tmp"
+        temp_fd = os.open(
+            str(temp_file_path_obj),
+            os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0),
+            0o666,
+        )
 
         logger.debug(f"Writing to temporary file '{temp_file_path_obj}' for target '{abs_path}'")
 
         # Write content to temporary file
         try:
-            temp_file_handle.write(content)
+            _write_content(temp_fd, content)
+            if mode is not None:
+                os.fchmod(temp_fd, mode)
         except UnicodeEncodeError as e:
             logger.error(f"Unicode encode error while writing to temp file for {abs_path}: {str(e)}")
             raise ValueError("Content contains characters that cannot be encoded.") from e
         finally:
-             if temp_file_handle: temp_file_handle.close() # Ensure file is closed before moving
+            os.close(temp_fd) # Ensure file is closed before moving
 
         # Atomically replace the target file
         logger.debug(f"Atomically replacing {abs_path} with {temp_file_path_obj}")
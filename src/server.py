@@ -1,16 +1,19 @@
 # src/server.py (Revised for Absolute Paths)
 
 import logging
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional # Added Optional
+from typing import Any, Dict, List, Optional, Union # Added Optional
 
 import structlog
 from mcp.server.fastmcp import FastMCP
 
 # Import utility functions
 from src.file_tools.directory_utils import list_files as list_files_util
+from src.file_tools.directory_utils import list_files_recursive as list_files_recursive_util
 from src.file_tools.directory_utils import find_files_spotlight, find_files_ripgrep
 from src.file_tools.file_operations import read_file as read_file_util
+from src.file_tools.file_operations import read_files_bulk as read_files_bulk_util
 from src.file_tools.file_operations import save_file as save_file_util
 from src.file_tools.file_operations import append_file as append_file_util
 from src.file_tools.file_operations import delete_file as delete_file_util
@@ -35,13 +38,22 @@ def _validate_abs_path(path_str: str, operation: str) -> Path:
     if not path_str or not isinstance(path_str, str):
         logger.error(f"{operation}: Invalid path parameter type: {type(path_str)}")
         raise ValueError(f"Path must be a non-empty string, got {type(path_str)}")
+
+    # Reject relative paths with a plain string check before building a Path object
+    if not os.path.isabs(path_str):
+        logger.error(f"{operation}: Path is not absolute: {path_str}")
+        raise ValueError(f"Path must be absolute, got: {path_str}")
+
     try:
         path_obj = Path(path_str)
     except Exception as e:
          logger.error(f"{operation}: Could not create Path object from '{path_str}': {e}")
          raise ValueError(f"Invalid path format: {path_str}") from e
 
-    if not path_obj.is_absolute():
+    # os.path.isabs() is authoritative on POSIX. On Windows before Python 3.13 it
+    # also accepts rooted paths without a drive (e.g. "\\dir"), which Path does not
+    # consider absolute, so only there is the Path check repeated
+    if os.name == "nt" and not path_obj.is_absolute():
         logger.error(f"{operation}: Path is not absolute: {path_str}")
         raise ValueError(f"Path must be absolute, got: {path_str}")
     return path_obj
@@ -68,6 +80,33 @@ def list_directory(abs_dir_path: str) -> List[str]:
         logger.error(f"Error listing absolute directory '{abs_dir_path}': {str(e)}")
         raise
 
+@mcp.tool()
+@log_function_call
+def list_directory_recursive(abs_dir_path: str, use_gitignore: bool = True) -> List[str]:
+    """
+    List all files below the specified ABSOLUTE directory (recursive).
+
+    Args:
+        abs_dir_path: The ABSOLUTE path to the directory to list.
+        use_gitignore: Skip files matched by .gitignore files (default: True). The
+            .gitignore of the directory and of every subdirectory below it are
+            applied, each to its own subtree; .gitignore files in directories
+            above it are not read. The .git directory is always skipped.
+
+    Returns:
+        A list of ABSOLUTE paths for all files below the specified directory.
+        Unreadable subdirectories are skipped; an unreadable directory itself
+        raises an error.
+    """
+    try:
+        path_obj = _validate_abs_path(abs_dir_path, "list_directory_recursive")
+        logger.info(f"Listing recursive contents of absolute directory: {path_obj}")
+        result = list_files_recursive_util(path_obj, use_gitignore=use_gitignore)
+        return result
+    except Exception as e:
+        logger.error(f"Error listing absolute directory '{abs_dir_path}' recursively: {str(e)}")
+        raise
+
 @mcp.tool()
 @log_function_call
 def read_file(abs_file_path: str) -> str:
@@ -89,6 +128,29 @@ def read_file(abs_file_path: str) -> str:
         logger.error(f"Error reading file '{abs_file_path}': {str(e)}")
         raise
 
+@mcp.tool()
+@log_function_call
+def read_files(abs_file_paths: List[str]) -> Dict[str, str]:
+    """
+    Read the contents of several files specified by ABSOLUTE paths in one call.
+
+    Args:
+        abs_file_paths: ABSOLUTE paths of the files to read.
+
+    Returns:
+        A dictionary mapping each path to the contents of that file.
+    """
+    try:
+        if not isinstance(abs_file_paths, list) or not abs_file_paths:
+            logger.error(f"Invalid abs_file_paths parameter: {abs_file_paths}")
+            raise ValueError("abs_file_paths must be a non-empty list")
+        path_objs = [_validate_abs_path(p, "read_files") for p in abs_file_paths]
+        logger.info(f"Reading {len(path_objs)} files")
+        return read_files_bulk_util(path_objs)
+    except Exception as e:
+        logger.error(f"Error reading files {abs_file_paths}: {str(e)}")
+        raise
+
 @mcp.tool()
 @log_function_call
 def save_file(abs_file_path: str, content: str) -> bool:
@@ -188,7 +250,8 @@ def edit_file(
         abs_file_path: ABSOLUTE path to the file to edit.
         edits: List of edit operations (old_text, new_text).
         dry_run: Preview changes without applying (default: False).
-        options: Optional formatting settings (e.g., preserve_indentation).
+        options: Optional formatting settings (e.g., preserve_indentation, or
+            return_diff=False to skip the diff when applying large edits).
 
     Returns:
         Detailed diff and match information including success status.
@@ -214,7 +277,7 @@ def edit_file(
 
         normalized_options = {}
         if options:
-            for opt in ["preserve_indentation", "normalize_whitespace"]:
+            for opt in ["preserve_indentation", "normalize_whitespace", "return_diff"]:
                 if opt in options:
                     normalized_options[opt] = options[opt]
 
@@ -263,7 +326,8 @@ def find_files_ripgrep_tool(
     abs_search_dir: str,
     case_sensitive: Optional[bool] = None,
     literal: bool = False,
-) -> List[Dict[str, Any]]:
+    details: bool = True,
+) -> Union[List[Dict[str, Any]], List[str]]:
     """
     Uses Ripgrep (rg) to search file contents recursively within a specified ABSOLUTE directory.
 
@@ -272,14 +336,17 @@ def find_files_ripgrep_tool(
         abs_search_dir: The ABSOLUTE root directory path to search within.
         case_sensitive: Control case sensitivity. None=smart case (default).
         literal: If True, treat query as a literal string (-F flag).
+        details: If False, return only the absolute paths of matching files, which
+            is much faster than returning every matching line.
 
     Returns:
-        A list of match dictionaries (containing absolute file paths).
+        A list of match dictionaries (containing absolute file paths), or a list of
+        absolute file paths if details is False.
     """
     try:
         path_obj = _validate_abs_path(abs_search_dir, "find_files_ripgrep_tool")
         logger.info(f"Searching Ripgrep in '{path_obj}' with query: '{query}'")
-        results = find_files_ripgrep(query, path_obj, case_sensitive, literal) # Pass Path object
+        results = find_files_ripgrep(query, path_obj, case_sensitive, literal, details) # Pass Path object
         return results
     except Exception as e:
         logger.error(f"Error during Ripgrep search in '{abs_search_dir}': {str(e)}")
@@ -0,0 +1,374 @@
+"""Tests for edit_file using the absolute-path API."""
+
+import difflib
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.file_tools.edit_file import (
+    EditOperation,
+    EditOptions,
+    apply_edits,
+    create_unified_diff,
+    create_unified_diff_lines,
+    edit_file,
+    edit_files,
+    preserve_indentation,
+)
+
+# The package re-exports the edit_file function under the module's name
+edit_file_module = sys.modules["src.file_tools.edit_file"]
+
+
+def test_edit_file_applies_edit(tmp_path):
+    """Test that a matching edit is written and reported with a diff."""
+    file_path = tmp_path / "test.py"
+    file_path.write_text("def a():\n    return 1\n", encoding="utf-8")
+
+    result = edit_file(file_path, [{"old_text": "return 1", "new_text": "return 2"}])
+
+    assert result["success"] is True
+    assert "-    return 1" in result["diff"]
+    assert "+    return 2" in result["diff"]
+    assert file_path.read_text(encoding="utf-8") == "def a():\n    return 2\n"
+
+
+def test_edit_file_dry_run_leaves_file_unchanged(tmp_path):
+    """Test that dry_run reports the diff without writing."""
+    file_path = tmp_path / "test.txt"
+    file_path.write_text("alpha\nbeta\n", encoding="utf-8")
+
+    result = edit_file(
+        file_path, [{"old_text": "beta", "new_text": "gamma"}], dry_run=True
+    )
+
+    assert result["success"] is True
+    assert "+gamma" in result["diff"]
+    assert file_path.read_text(encoding="utf-8") == "alpha\nbeta\n"
+
+
+def test_edit_file_failed_match(tmp_path):
+    """Test that an edit without a match fails and leaves the file unchanged."""
+    file_path = tmp_path / "test.txt"
+    file_path.write_text("alpha\n", encoding="utf-8")
+
+    result = edit_file(file_path, [{"old_text": "missing", "new_text": "x"}])
+
+    assert result["success"] is False
+    assert result["match_results"][0]["match_type"] == "failed"
+    assert file_path.read_text(encoding="utf-8") == "alpha\n"
+
+
+def test_edit_file_not_found(tmp_path):
+    """Test editing a file that does not exist."""
+    with pytest.raises(FileNotFoundError):
+        edit_file(tmp_path / "missing.txt", [{"old_text": "a", "new_text": "b"}])
+
+
+def test_create_unified_diff_hunks():
+    """Test that the diff carries both file headers and the changed hunk."""
+    diff = create_unified_diff("a\nb\nc\n", "a\nB\nc\n", "/tmp/f.txt")
+
+    assert "--- a//tmp/f.txt" in diff
+    assert "+++ b//tmp/f.txt" in diff
+    assert diff.endswith("@@ -1,3 +1,3 @@ a\n-b\n+B\n c\n")
+    assert (
+        create_unified_diff_lines(
+            ["a\n", "b\n", "c\n"], ["a\n", "B\n", "c\n"], "/tmp/f.txt"
+        )
+        == diff
+    )
+
+
+def test_create_unified_diff_large_file_hunk_numbers():
+    """Test that trimming unchanged lines of a large file keeps difflib's hunks."""
+    original = [f"line {i}\n" for i in range(1000)]
+    modified = original[:500] + ["changed\n"] + original[501:]
+
+    diff = create_unified_diff("".join(original), "".join(modified), "f.txt")
+
+    assert "@@ -498,7 +498,7 @@" in diff
+    assert diff == "".join(
+        difflib.unified_diff(
+            original, modified, fromfile="a/f.txt", tofile="b/f.txt", lineterm=""
+        )
+    )
+
+
+def test_create_unified_diff_large_file_insert_next_to_identical_line():
+    """Test that an insert difflib may place earlier still gets full context."""
+    original = [f"line {i}\n" if i % 10 else "\n" for i in range(1000)]
+    # A blank line inserted right after an existing one
+    modified = original[:201] + ["\n"] + original[201:]
+
+    assert edit_file_module._diff_window(original, modified) is not None
+    diff = create_unified_diff("".join(original), "".join(modified), "f.txt")
+
+    assert diff == "".join(
+        difflib.unified_diff(
+            original, modified, fromfile="a/f.txt", tofile="b/f.txt", lineterm=""
+        )
+    )
+    assert "@@ -199,6 +199,7 @@ line 198\n line 199\n \n+\n line 201\n" in diff
+
+
+@pytest.mark.parametrize("position", [3, 250, 505, 996])
+def test_create_unified_diff_window_matches_difflib(position):
+    """Test that the trimmed diff equals difflib's, with popular lines in the file."""
+
+    def line(i):
+        # Blank lines and braces each occur more than len(b) // 100 + 1 times, so
+        # difflib's autojunk treats them as popular; the return line repeats
+        # without being popular
+        if i % 10 == 0:
+            return "\n"
+        if i % 10 == 5:
+            return "}\n"
+        if i % 100 == 33:
+            return "    return value\n"
+        return f"line {i}\n"
+
+    original = [line(i) for i in range(1000)]
+    modified = original[:position] + ["\n", "new\n", "}\n"] + original[position + 2 :]
+
+    assert edit_file_module._diff_window(original, modified) is not None
+    diff = create_unified_diff("".join(original), "".join(modified), "f.txt")
+
+    assert diff == "".join(
+        difflib.unified_diff(
+            original, modified, fromfile="a/f.txt", tofile="b/f.txt", lineterm=""
+        )
+    )
+
+
+def _apply_sequentially(content, edits, options, monkeypatch):
+    """Apply edits with the batched fast path disabled."""
+    with monkeypatch.context() as m:
+        m.setattr(edit_file_module, "_apply_edits_batched", lambda *args: None)
+        return apply_edits(content, edits, options)
+
+
+def test_apply_edits_batched_matches_sequential(monkeypatch):
+    """Test that independent edits give the same result as applying them in order."""
+    content = "one\n--\ntwo\n--\nthree\n--\nfour\n--\nfive\n"
+    edits = [
+        EditOperation("four", "FOUR\nand more"),
+        EditOperation("two", "TWO"),
+        EditOperation("five", "five"),
+        EditOperation("one\n", ""),
+    ]
+    options = EditOptions(preserve_indentation=False)
+
+    pairs = [(edit.old_text, edit.new_text) for edit in edits]
+    assert edit_file_module._apply_edits_batched(content, pairs, options) is not None
+    result = apply_edits(content, edits, options)
+
+    assert result == _apply_sequentially(content, edits, options, monkeypatch)
+    assert result[0] == "--\nTWO\n--\nthree\n--\nFOUR\nand more\n--\nfive\n"
+    assert [r.get("line_index") for r in result[1]] == [6, 2, None, 0]
+
+
+def test_apply_edits_falls_back_when_edits_interact(monkeypatch):
+    """Test that an edit matching text produced by an earlier edit is applied in order."""
+    content = "alpha\nbeta\n"
+    edits = [
+        EditOperation("alpha", "beta"),
+        EditOperation("beta", "gamma"),
+    ]
+    options = EditOptions(preserve_indentation=False)
+
+    pairs = [(edit.old_text, edit.new_text) for edit in edits]
+    assert edit_file_module._apply_edits_batched(content, pairs, options) is None
+    result = apply_edits(content, edits, options)
+
+    assert result == _apply_sequentially(content, edits, options, monkeypatch)
+    assert result[0] == "gamma\nbeta\n"
+
+
+def test_apply_edits_many_edits_are_applied_in_order(monkeypatch):
+    """Test that edits beyond the batching limit skip the pairwise batched path."""
+    count = edit_file_module._BATCH_MAX_EDITS + 1
+    content = "".join(f"line {i}\n" for i in range(count))
+    edits = [EditOperation(f"line {i}\n", f"LINE {i}\n") for i in range(count)]
+    options = EditOptions(preserve_indentation=False)
+
+    def fail(*args):
+        raise AssertionError("batched path used")
+
+    monkeypatch.setattr(edit_file_module, "_apply_edits_batched", fail)
+    result = apply_edits(content, edits, options)
+
+    assert result[0] == "".join(f"LINE {i}\n" for i in range(count))
+    assert [r["line_index"] for r in result[1]] == list(range(count))
+
+
+@pytest.mark.skipif(not hasattr(os, "fchmod"), reason="needs POSIX permissions")
+def test_edit_file_keeps_permissions(tmp_path):
+    """Test that the atomic rewrite keeps the file's permission bits."""
+    file_path = tmp_path / "script.sh"
+    file_path.write_text("echo one\n", encoding="utf-8")
+    file_path.chmod(0o751)
+
+    result = edit_file(file_path, [{"old_text": "one", "new_text": "two"}])
+
+    assert result["success"] is True
+    assert file_path.read_text(encoding="utf-8") == "echo two\n"
+    assert stat.S_IMODE(file_path.stat().st_mode) == 0o751
+    assert [p.name for p in tmp_path.iterdir()] == ["script.sh"]
+
+
+@pytest.mark.skipif(
+    os.name == "nt" or os.geteuid() == 0,
+    reason="needs POSIX permissions that apply to the current user",
+)
+def test_edit_file_in_read_only_directory(tmp_path):
+    """Test that a writable file in a read-only directory is rewritten in place."""
+    directory = tmp_path / "locked"
+    directory.mkdir()
+    file_path = directory / "test.txt"
+    file_path.write_text("value one\n", encoding="utf-8")
+    directory.chmod(0o555)
+    try:
+        result = edit_file(file_path, [{"old_text": "one", "new_text": "two"}])
+    finally:
+        directory.chmod(0o755)
+
+    assert result["success"] is True
+    assert file_path.read_text(encoding="utf-8") == "value two\n"
+    assert [p.name for p in directory.iterdir()] == ["test.txt"]
+
+
+@pytest.mark.skipif(not hasattr(os, "link"), reason="needs hard link support")
+def test_edit_file_keeps_hard_links(tmp_path):
+    """Test that a file with several hard links is edited through all of them."""
+    file_path = tmp_path / "test.txt"
+    file_path.write_text("value one\n", encoding="utf-8")
+    other_path = tmp_path / "other.txt"
+    os.link(file_path, other_path)
+    inode = file_path.stat().st_ino
+
+    result = edit_file(file_path, [{"old_text": "one", "new_text": "two"}])
+
+    assert result["success"] is True
+    assert other_path.read_text(encoding="utf-8") == "value two\n"
+    assert file_path.stat().st_ino == inode
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlink support")
+def test_edit_file_through_symlink_edits_target(tmp_path):
+    """Test that editing through a symlink rewrites the target and keeps the link."""
+    target = tmp_path / "target.txt"
+    target.write_text("alpha\n", encoding="utf-8")
+    link = tmp_path / "link.txt"
+    link.symlink_to(target)
+
+    result = edit_file(link, [{"old_text": "alpha", "new_text": "beta"}])
+
+    assert result["success"] is True
+    assert link.is_symlink()
+    assert target.read_text(encoding="utf-8") == "beta\n"
+
+
+def test_preserve_indentation_uses_nearest_shallower_line():
+    """Test that extra new lines are indented relative to the nearest fitting line."""
+    old_text = "    if a:\n        b()"
+    new_text = "  if a:\n      b()\n          c()\n      d()\n  e()"
+
+    assert preserve_indentation(old_text, new_text) == (
+        "    if a:\n        b()\n            c()\n        d()\n    e()"
+    )
+
+
+def test_edit_file_without_diff(tmp_path):
+    """Test that return_diff=False skips the diff when writing but not in dry runs."""
+    file_path = tmp_path / "test.txt"
+    file_path.write_text("alpha\n", encoding="utf-8")
+    edits = [{"old_text": "alpha", "new_text": "beta"}]
+
+    preview = edit_file(file_path, edits, dry_run=True, options={"return_diff": False})
+    result = edit_file(file_path, edits, options={"return_diff": False})
+
+    assert "+beta" in preview["diff"]
+    assert result["success"] is True
+    assert result["diff"] is None
+    assert file_path.read_text(encoding="utf-8") == "beta\n"
+
+
+def test_preserve_indentation_unchanged_indents():
+    """Test that matching indentation is kept as is but blank lines are emptied."""
+    old_text = "    a()\n    b()"
+
+    assert preserve_indentation(old_text, "    x()\n    y()") == "    x()\n    y()"
+    assert preserve_indentation(old_text, "    x()\n    ") == "    x()\n"
+
+
+def test_edit_files_preserves_order(tmp_path, monkeypatch):
+    """Test that editing several files in worker processes keeps the input order."""
+    monkeypatch.setattr(edit_file_module, "_PROCESS_POOL_MIN_BYTES", 0)
+    monkeypatch.setattr(edit_file_module.os, "cpu_count", lambda: 2)
+    paths = []
+    for i in range(3):
+        file_path = tmp_path / f"test{i}.txt"
+        file_path.write_text(f"value {i}\n", encoding="utf-8")
+        paths.append(file_path)
+    items = [
+        (path, [{"old_text": f"value {i}", "new_text": f"new {i}"}], False, None)
+        for i, path in enumerate(paths)
+    ]
+
+    results = edit_files(items)
+
+    assert [r["file_path"] for r in results] == [str(p) for p in paths]
+    assert all(r["success"] for r in results)
+    assert [p.read_text(encoding="utf-8") for p in paths] == [
+        "new 0\n",
+        "new 1\n",
+        "new 2\n",
+    ]
+
+
+@pytest.mark.parametrize("cpu_count", [1, 4])
+def test_edit_files_small_or_single_worker_runs_inline(
+    tmp_path, monkeypatch, cpu_count
+):
+    """Test that small inputs and a single CPU are edited without worker processes."""
+    monkeypatch.setattr(edit_file_module.os, "cpu_count", lambda: cpu_count)
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("worker processes started")
+
+    monkeypatch.setattr(edit_file_module, "ProcessPoolExecutor", no_pool)
+    paths = [tmp_path / f"test{i}.txt" for i in range(3)]
+    for i, path in enumerate(paths):
+        path.write_text(f"value {i}\n", encoding="utf-8")
+    items = [
+        (path, [{"old_text": f"value {i}", "new_text": f"new {i}"}], False, None)
+        for i, path in enumerate(paths)
+    ]
+
+    results = edit_files(items)
+
+    assert all(r["success"] for r in results)
+    assert [p.read_text(encoding="utf-8") for p in paths] == [
+        "new 0\n",
+        "new 1\n",
+        "new 2\n",
+    ]
+
+
+def test_edit_files_same_file_applied_in_order(tmp_path):
+    """Test that items naming the same file are applied one after another."""
+    file_path = tmp_path / "test.txt"
+    file_path.write_text("alpha\n", encoding="utf-8")
+    items = [
+        (file_path, [{"old_text": "alpha", "new_text": "beta"}], False, None),
+        (file_path, [{"old_text": "beta", "new_text": "gamma"}], False, None),
+    ]
+
+    results = edit_files(items)
+
+    assert [r["success"] for r in results] == [True, True]
+    assert file_path.read_text(encoding="utf-8") == "gamma\n"
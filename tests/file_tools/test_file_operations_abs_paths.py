@@ -0,0 +1,182 @@
+"""Tests for file operations using the absolute-path API."""
+
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from src.file_tools import file_operations
+from src.file_tools.file_operations import read_file, read_files_bulk, save_file
+
+
+def test_read_file_returns_content(tmp_path):
+    """Test reading a UTF-8 text file."""
+    file_path = tmp_path / "test_file.txt"
+    file_path.write_bytes("Line 1\nLïne 2\n".encode("utf-8"))
+
+    assert read_file(file_path) == "Line 1\nLïne 2\n"
+
+
+def test_read_file_empty(tmp_path):
+    """Test reading an empty file."""
+    file_path = tmp_path / "empty.txt"
+    file_path.write_bytes(b"")
+
+    assert read_file(file_path) == ""
+
+
+def test_read_file_translates_newlines(tmp_path):
+    """Test that CRLF and CR line endings are read as LF, like text mode."""
+    file_path = tmp_path / "crlf.txt"
+    file_path.write_bytes(b"one\r\ntwo\rthree\n")
+
+    assert read_file(file_path) == "one\ntwo\nthree\n"
+
+
+@pytest.mark.parametrize("size_delta", [-100, -1, 0, 1, 100])
+def test_read_file_size_changed_since_fstat(tmp_path, monkeypatch, size_delta):
+    """Test that the whole file is read if it grew or shrank after fstat()."""
+    file_path = tmp_path / "changing.txt"
+    content = "".join(f"line {i}\n" for i in range(50))
+    file_path.write_bytes(content.encode("utf-8"))
+
+    real_fstat = os.fstat
+
+    def stale_fstat(fd):
+        st = list(real_fstat(fd))
+        st[stat.ST_SIZE] = max(0, st[stat.ST_SIZE] + size_delta)
+        return os.stat_result(st)
+
+    monkeypatch.setattr(file_operations.os, "fstat", stale_fstat)
+
+    assert read_file(file_path) == content
+
+
+def test_read_file_invalid_utf8(tmp_path):
+    """Test that undecodable content raises ValueError."""
+    file_path = tmp_path / "binary.txt"
+    file_path.write_bytes(b"\xff\xfe\x00")
+
+    with pytest.raises(ValueError):
+        read_file(file_path)
+
+
+def test_read_file_not_found(tmp_path):
+    """Test reading a file that does not exist."""
+    with pytest.raises(FileNotFoundError):
+        read_file(tmp_path / "missing.txt")
+
+
+def test_read_file_is_directory(tmp_path):
+    """Test reading a directory instead of a file."""
+    with pytest.raises(IsADirectoryError):
+        read_file(tmp_path)
+
+
+def test_save_file_writes_content(tmp_path):
+    """Test writing a new file, creating parent directories."""
+    file_path = tmp_path / "new_dir" / "test_file.txt"
+
+    assert save_file(file_path, "Hëllo\nWorld\n") is True
+    assert file_path.read_bytes() == "Hëllo\nWorld\n".encode("utf-8")
+
+
+def test_save_file_overwrites_atomically(tmp_path):
+    """Test overwriting an existing file leaves no temporary files behind."""
+    file_path = tmp_path / "test_file.txt"
+    file_path.write_text("old content", encoding="utf-8")
+
+    assert save_file(file_path, "new content") is True
+
+    assert file_path.read_text(encoding="utf-8") == "new content"
+    assert [p.name for p in tmp_path.iterdir()] == ["test_file.txt"]
+
+
+def test_save_file_unencodable_content(tmp_path):
+    """Test that unencodable content raises ValueError and keeps the old file."""
+    file_path = tmp_path / "test_file.txt"
+    file_path.write_text("old content", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        save_file(file_path, "bad \ud800 surrogate")
+
+    assert file_path.read_text(encoding="utf-8") == "old content"
+    assert [p.name for p in tmp_path.iterdir()] == ["test_file.txt"]
+
+
+def test_save_file_without_o_tmpfile_uses_exclusive_temp_file(tmp_path, monkeypatch):
+    """Test the hidden O_EXCL temp file fallback used when O_TMPFILE is unavailable."""
+    monkeypatch.setattr(file_operations, "_save_file_tmpfile", lambda *args: False)
+    file_path = tmp_path / "test_file.txt"
+    file_path.write_text("old content", encoding="utf-8")
+
+    assert save_file(file_path, "new content") is True
+
+    assert file_path.read_text(encoding="utf-8") == "new content"
+    assert [p.name for p in tmp_path.iterdir()] == ["test_file.txt"]
+
+
+def test_save_file_overwrite_skips_o_tmpfile(tmp_path, monkeypatch):
+    """Test that replacing an existing file does not try the O_TMPFILE link first."""
+
+    def no_tmpfile(*args):
+        raise AssertionError("O_TMPFILE path used for an existing file")
+
+    monkeypatch.setattr(file_operations, "_save_file_tmpfile", no_tmpfile)
+    file_path = tmp_path / "test_file.txt"
+    file_path.write_text("old content", encoding="utf-8")
+
+    assert save_file(file_path, "new content") is True
+
+    assert file_path.read_text(encoding="utf-8") == "new content"
+    assert [p.name for p in tmp_path.iterdir()] == ["test_file.txt"]
+
+
+@pytest.mark.parametrize("use_tmpfile", [True, False])
+def test_save_file_new_file_mode_follows_umask(tmp_path, monkeypatch, use_tmpfile):
+    """Test that a new file gets 0o666 minus the umask on both write paths."""
+    if not use_tmpfile:
+        monkeypatch.setattr(file_operations, "_save_file_tmpfile", lambda *args: False)
+    file_path = tmp_path / "new_file.txt"
+
+    old_umask = os.umask(0o027)
+    try:
+        assert save_file(file_path, "content") is True
+    finally:
+        os.umask(old_umask)
+
+    assert stat.S_IMODE(file_path.stat().st_mode) == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == ["new_file.txt"]
+
+
+def test_read_files_bulk_preserves_order(tmp_path):
+    """Test reading several files at once returns contents keyed by path in order."""
+    paths = []
+    for i in range(10):
+        file_path = tmp_path / f"test{i}.txt"
+        file_path.write_text(f"content {i}", encoding="utf-8")
+        paths.append(file_path)
+
+    result = read_files_bulk(paths)
+
+    assert list(result) == [str(p) for p in paths]
+    assert result[str(paths[3])] == "content 3"
+
+
+def test_read_files_bulk_propagates_errors(tmp_path):
+    """Test that a missing file makes the bulk read fail."""
+    file_path = tmp_path / "test1.txt"
+    file_path.write_text("content", encoding="utf-8")
+
+    with pytest.raises(FileNotFoundError):
+        read_files_bulk([file_path, tmp_path / "missing.txt"])
+
+
+def test_read_file_large_file(tmp_path):
+    """Test reading a file large enough to get a readahead hint."""
+    file_path = tmp_path / "large.txt"
+    content = "0123456789abcdef\n" * 50000
+    file_path.write_bytes(content.encode("utf-8"))
+
+    assert read_file(file_path) == content
@@ -0,0 +1,67 @@
+"""Tests for the non-recursive absolute-path directory listing."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.file_tools.directory_utils import list_entries, list_files
+
+
+def test_list_files_returns_direct_children(tmp_path):
+    """Test that files and directories directly inside are listed as absolute paths."""
+    (tmp_path / "a.txt").write_text("a", encoding="utf-8")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "nested.txt").write_text("n", encoding="utf-8")
+
+    result = list_files(tmp_path)
+
+    assert sorted(result) == sorted([str(tmp_path / "a.txt"), str(tmp_path / "sub")])
+
+
+def test_list_files_not_found(tmp_path):
+    """Test listing a directory that does not exist."""
+    with pytest.raises(FileNotFoundError):
+        list_files(tmp_path / "missing")
+
+
+def test_list_files_not_a_directory(tmp_path):
+    """Test listing a file instead of a directory."""
+    file_path = tmp_path / "not_a_dir.txt"
+    file_path.write_text("x", encoding="utf-8")
+
+    with pytest.raises(NotADirectoryError):
+        list_files(file_path)
+
+
+def test_list_entries_reports_directory_flag(tmp_path):
+    """Test that each entry is paired with whether it is a directory."""
+    (tmp_path / "a.txt").write_text("a", encoding="utf-8")
+    (tmp_path / "sub").mkdir()
+
+    result = list_entries(tmp_path)
+
+    assert sorted(result) == [
+        (str(tmp_path / "a.txt"), False),
+        (str(tmp_path / "sub"), True),
+    ]
+
+    with pytest.raises(FileNotFoundError):
+        list_entries(tmp_path / "missing")
+
+
+def test_list_files_large_directory(tmp_path):
+    """Test that directories above the inode-sort threshold are listed completely."""
+    expected = []
+    for i in range(50):
+        file_path = tmp_path / f"file{i:02d}.txt"
+        file_path.write_text(str(i), encoding="utf-8")
+        expected.append(str(file_path))
+
+    result = list_files(tmp_path)
+
+    assert sorted(result) == expected
+    if os.name != "nt":
+        assert [os.stat(p).st_ino for p in result] == sorted(
+            os.stat(p).st_ino for p in result
+        )
@@ -0,0 +1,398 @@
+"""Tests for the recursive, gitignore-aware directory listing."""
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from src.file_tools import directory_utils
+from src.file_tools.directory_utils import (
+    iter_files,
+    list_files_detailed,
+    list_files_recursive,
+)
+
+
+def _make_files(root: Path, rel_paths):
+    """Create empty files (and their parent directories) below root."""
+    for rel_path in rel_paths:
+        file_path = root / rel_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(f"Content for {rel_path}", encoding="utf-8")
+
+
+def _rel(root: Path, abs_paths):
+    """Convert absolute result paths to a set of POSIX-style relative paths."""
+    return {Path(p).relative_to(root).as_posix() for p in abs_paths}
+
+
+def test_list_files_recursive_returns_absolute_file_paths(tmp_path):
+    """Test that files in nested directories are listed with absolute paths."""
+    _make_files(tmp_path, ["a.txt", "sub/b.txt", "sub/deeper/c.txt"])
+
+    result = list_files_recursive(tmp_path)
+
+    assert all(Path(p).is_absolute() for p in result)
+    assert _rel(tmp_path, result) == {"a.txt", "sub/b.txt", "sub/deeper/c.txt"}
+
+
+def test_list_files_recursive_skips_git_directory(tmp_path):
+    """Test that the .git directory is never listed."""
+    _make_files(tmp_path, ["a.txt", ".git/config", ".git/objects/ab"])
+
+    assert _rel(tmp_path, list_files_recursive(tmp_path)) == {"a.txt"}
+    assert _rel(tmp_path, list_files_recursive(tmp_path, use_gitignore=False)) == {
+        "a.txt"
+    }
+
+
+def test_list_files_recursive_respects_gitignore(tmp_path):
+    """Test that files and directories matched by .gitignore are skipped."""
+    _make_files(
+        tmp_path,
+        [
+            "keep.txt",
+            "ignore.log",
+            "dont_ignore.log",
+            "build/out.txt",
+            "src/build/nested.txt",
+            "src/main.py",
+        ],
+    )
+    (tmp_path / ".gitignore").write_text(
+        "*.log\n!dont_ignore.log\nbuild/\n", encoding="utf-8"
+    )
+
+    result = _rel(tmp_path, list_files_recursive(tmp_path))
+
+    assert result == {".gitignore", "keep.txt", "dont_ignore.log", "src/main.py"}
+
+
+def test_list_files_recursive_without_gitignore(tmp_path):
+    """Test that use_gitignore=False lists ignored files too."""
+    _make_files(tmp_path, ["keep.txt", "ignore.log"])
+    (tmp_path / ".gitignore").write_text("*.log\n", encoding="utf-8")
+
+    result = _rel(tmp_path, list_files_recursive(tmp_path, use_gitignore=False))
+
+    assert result == {".gitignore", "keep.txt", "ignore.log"}
+
+
+def test_list_files_recursive_errors(tmp_path):
+    """Test error handling for missing directories and file arguments."""
+    with pytest.raises(FileNotFoundError):
+        list_files_recursive(tmp_path / "missing")
+
+    file_path = tmp_path / "not_a_dir.txt"
+    file_path.write_text("x", encoding="utf-8")
+    with pytest.raises(NotADirectoryError):
+        list_files_recursive(file_path)
+
+
+def test_list_files_recursive_picks_up_gitignore_changes(tmp_path):
+    """Test that cached gitignore specs are rebuilt when .gitignore changes."""
+    _make_files(tmp_path, ["keep.txt", "ignore.log", "other.tmp"])
+    gitignore = tmp_path / ".gitignore"
+    gitignore.write_text("*.log\n", encoding="utf-8")
+
+    assert _rel(tmp_path, list_files_recursive(tmp_path)) == {
+        ".gitignore",
+        "keep.txt",
+        "other.tmp",
+    }
+
+    gitignore.write_text("*.log\n*.tmp\n", encoding="utf-8")
+
+    assert _rel(tmp_path, list_files_recursive(tmp_path)) == {".gitignore", "keep.txt"}
+
+
+def test_list_files_recursive_prunes_ignored_directories(tmp_path, monkeypatch):
+    """Test that ignored directories are skipped without being scanned."""
+    _make_files(tmp_path, ["keep.txt", "node_modules/pkg/index.js", "src/a.py"])
+    (tmp_path / ".gitignore").write_text("node_modules/\n", encoding="utf-8")
+
+    scanned = []
+    real_scandir = os.scandir
+
+    def recording_scandir(path):
+        scanned.append(Path(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(directory_utils.os, "scandir", recording_scandir)
+
+    result = _rel(tmp_path, list_files_recursive(tmp_path))
+
+    assert result == {".gitignore", "keep.txt", "src/a.py"}
+    assert tmp_path / "node_modules" not in scanned
+    assert tmp_path / "node_modules" / "pkg" not in scanned
+
+
+def test_list_files_recursive_nested_gitignore(tmp_path):
+    """Test that nested .gitignore files apply to their own subtree only."""
+    _make_files(
+        tmp_path,
+        [
+            "top.tmp",
+            "pkg/data.tmp",
+            "pkg/keep.log",
+            "pkg/other.log",
+            "pkg/sub/deep.tmp",
+            "other/data.tmp",
+        ],
+    )
+    (tmp_path / ".gitignore").write_text("*.log\n", encoding="utf-8")
+    (tmp_path / "pkg" / ".gitignore").write_text("*.tmp\n!keep.log\n", encoding="utf-8")
+
+    result = _rel(tmp_path, list_files_recursive(tmp_path))
+
+    assert result == {
+        ".gitignore",
+        "top.tmp",
+        "pkg/.gitignore",
+        "pkg/keep.log",
+        "other/data.tmp",
+    }
+
+
+@pytest.mark.parametrize(
+    "patterns",
+    [
+        ["*.log", "build/", "/dist", "**/node_modules/", "docs/*.md"],
+        ["*.log", "!keep.log", "tmp/"],
+        ["# only a comment", ""],
+        ["*/"],
+        ["**/", "*.log"],
+    ],
+)
+def test_compiled_gitignore_matches_pathspec(patterns):
+    """Test that the union-regex fast path agrees with pathspec on unpruned paths."""
+    spec = directory_utils.pathspec.GitIgnoreSpec.from_lines(patterns)
+    compiled = directory_utils._CompiledGitignore(spec)
+    candidates = [
+        "a.log",
+        "keep.log",
+        "src/keep.log",
+        "build/",
+        "src/build/",
+        "build",
+        "dist",
+        "dist/",
+        "src/dist/",
+        "node_modules/",
+        "a/b/node_modules/",
+        "docs/readme.md",
+        "docs/sub/readme.md",
+        "tmp/",
+        "main.py",
+        "sub/",
+        "sub/deep/",
+    ]
+    for candidate in candidates:
+        parts = candidate.rstrip("/").split("/")
+        parents = ["/".join(parts[:i]) + "/" for i in range(1, len(parts))]
+        # The traversal never reaches paths below an ignored directory
+        if any(spec.match_file(parent) for parent in parents):
+            continue
+        assert (
+            compiled.check(candidate) == spec.check_file(candidate).include
+        ), candidate
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+@pytest.mark.parametrize(
+    "gitignores",
+    [
+        {".gitignore": "*/\n!src\n"},
+        {".gitignore": "build\n", "src/.gitignore": "!build\n"},
+        {".gitignore": "*.log\n!keep.log\nlogs/\n!logs/keep/\n"},
+        {".gitignore": "d/**\n!d/keep\n"},
+        {".gitignore": "d/**/\n!d/sub/\n"},
+        {".gitignore": "b/**\n", "b/b/.gitignore": "!a\n"},
+        {".gitignore": "src/**\n", "src/.gitignore": "!main.py\n"},
+    ],
+)
+def test_list_files_recursive_negation_matches_git(tmp_path, gitignores):
+    """Test that negations and nested .gitignore files re-include exactly what git does."""
+    _make_files(
+        tmp_path,
+        [
+            "src/main.py",
+            "src/node_modules/pkg/index.js",
+            "src/build/out.o",
+            "src/build/build/deep.o",
+            "logs/keep/a.log",
+            "logs/keep.log",
+            "d/keep",
+            "d/other",
+            "d/sub/x.txt",
+            "d/more/y.txt",
+            "b/b/a",
+            "b/c",
+            "top.txt",
+        ],
+    )
+    for rel_path, content in gitignores.items():
+        (tmp_path / rel_path).write_text(content, encoding="utf-8")
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    git_files = subprocess.run(
+        # A developer's global excludes file must not change git's answer
+        [
+            "git",
+            "-c",
+            "core.excludesFile=/dev/null",
+            "-C",
+            str(tmp_path),
+            "ls-files",
+            "-o",
+            "--exclude-standard",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.splitlines()
+
+    assert _rel(tmp_path, list_files_recursive(tmp_path)) == set(git_files)
+
+
+@pytest.mark.parametrize("pattern", ["*/", "**/"])
+def test_list_files_recursive_ignores_all_directories(tmp_path, pattern):
+    """Test that "*/" and "**/" ignore every subdirectory but no top-level file."""
+    _make_files(tmp_path, ["top.txt", "sub/a.txt", "sub/deep/b.txt"])
+    (tmp_path / ".gitignore").write_text(f"{pattern}\n", encoding="utf-8")
+
+    result = _rel(tmp_path, list_files_recursive(tmp_path))
+
+    assert result == {".gitignore", "top.txt"}
+
+
+def test_iter_files_is_lazy_and_validates_eagerly(tmp_path):
+    """Test that iter_files yields paths lazily but rejects bad input immediately."""
+    _make_files(tmp_path, ["a.txt", "sub/b.txt"])
+
+    iterator = iter_files(tmp_path)
+    first = next(iterator)
+    assert Path(first).is_absolute()
+    assert _rel(tmp_path, [first, *iterator]) == {"a.txt", "sub/b.txt"}
+
+    with pytest.raises(FileNotFoundError):
+        iter_files(tmp_path / "missing")
+
+
+def test_list_files_detailed_returns_absolute_and_relative_paths(tmp_path):
+    """Test that each result pairs the absolute path with its relative path."""
+    _make_files(tmp_path, ["a.txt", "sub/deeper/c.txt", "skip.log"])
+    (tmp_path / ".gitignore").write_text("*.log\n", encoding="utf-8")
+
+    result = list_files_detailed(tmp_path)
+
+    assert {rel for _, rel in result} == {".gitignore", "a.txt", "sub/deeper/c.txt"}
+    for abs_path, rel_path in result:
+        assert Path(abs_path) == tmp_path / rel_path
+
+
+def test_list_files_recursive_directory_only_patterns(tmp_path):
+    """Test that 'name/' patterns match directories but not files of that name."""
+    _make_files(tmp_path, ["logs/app.txt", "src/logs", "src/keep.txt"])
+    (tmp_path / ".gitignore").write_text("logs/\n", encoding="utf-8")
+
+    result = _rel(tmp_path, list_files_recursive(tmp_path))
+
+    assert result == {".gitignore", "src/logs", "src/keep.txt"}
+
+
+def test_list_files_recursive_parallel_matches_sequential(tmp_path):
+    """Test that the thread-pool walk returns the same files as the sequential one."""
+    _make_files(
+        tmp_path,
+        [
+            "top.txt",
+            "a/one.txt",
+            "a/skip.log",
+            "b/c/two.txt",
+            "d/.gitignore",
+            "d/x.tmp",
+        ],
+    )
+    (tmp_path / ".gitignore").write_text("*.log\n", encoding="utf-8")
+    (tmp_path / "d" / ".gitignore").write_text("*.tmp\n", encoding="utf-8")
+
+    sequential = list_files_recursive(tmp_path)
+    parallel = list_files_recursive(tmp_path, parallel=True)
+
+    assert sorted(parallel) == sorted(sequential)
+    assert _rel(tmp_path, parallel) == {
+        ".gitignore",
+        "top.txt",
+        "a/one.txt",
+        "b/c/two.txt",
+        "d/.gitignore",
+    }
+    with pytest.raises(FileNotFoundError):
+        list_files_recursive(tmp_path / "missing", parallel=True)
+
+
+def test_gitignore_specs_are_compiled_once_while_unchanged(tmp_path):
+    """Test that repeated listings reuse the compiled .gitignore patterns."""
+    _make_files(tmp_path, ["keep.txt", "ignore.log"])
+    (tmp_path / ".gitignore").write_text("*.log\n", encoding="utf-8")
+    directory_utils._compile_gitignore.cache_clear()
+
+    list_files_recursive(tmp_path)
+    list_files_recursive(tmp_path)
+
+    # pylint: disable-next=no-value-for-parameter  # lru_cache wrapper, not the function
+    info = directory_utils._compile_gitignore.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+
+def test_identical_gitignore_files_share_compiled_spec(tmp_path):
+    """Test that .gitignore files with the same content are compiled only once."""
+    _make_files(tmp_path, ["a/x.log", "a/keep.txt", "b/y.log", "b/keep.txt"])
+    (tmp_path / "a" / ".gitignore").write_text("*.log\n", encoding="utf-8")
+    (tmp_path / "b" / ".gitignore").write_text("*.log\n", encoding="utf-8")
+    directory_utils._compile_gitignore.cache_clear()
+    directory_utils._compile_gitignore_content.cache_clear()
+
+    result = _rel(tmp_path, list_files_recursive(tmp_path))
+
+    assert result == {"a/.gitignore", "a/keep.txt", "b/.gitignore", "b/keep.txt"}
+    # pylint: disable-next=no-value-for-parameter  # lru_cache wrapper, not the function
+    assert directory_utils._compile_gitignore.cache_info().misses == 2
+    assert directory_utils._compile_gitignore_content.cache_info().misses == 1
+
+
+def _deny_scandir(monkeypatch, denied):
+    """Make os.scandir raise PermissionError for the given directory."""
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if Path(path) == denied:
+            raise PermissionError(f"Permission denied: '{path}'")
+        return real_scandir(path)
+
+    monkeypatch.setattr(directory_utils.os, "scandir", scandir)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_list_files_recursive_unreadable_root_raises(tmp_path, monkeypatch, parallel):
+    """Test that an unreadable directory raises instead of listing as empty."""
+    _make_files(tmp_path, ["a.txt"])
+    _deny_scandir(monkeypatch, tmp_path)
+
+    with pytest.raises(PermissionError):
+        list_files_recursive(tmp_path, parallel=parallel)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_list_files_recursive_skips_unreadable_subdirectory(
+    tmp_path, monkeypatch, parallel
+):
+    """Test that an unreadable subdirectory is skipped."""
+    _make_files(tmp_path, ["a.txt", "locked/b.txt", "open/c.txt"])
+    _deny_scandir(monkeypatch, tmp_path / "locked")
+
+    result = _rel(tmp_path, list_files_recursive(tmp_path, parallel=parallel))
+
+    assert result == {"a.txt", "open/c.txt"}